@@ -392,25 +392,23 @@ class ViewportEngine(Engine):
         scene = depsgraph.scene
         objects_prim = self.stage.GetPrimAtPath(f"/{sdf_path(scene.name)}/objects")
 
-        def depsgraph_objects():
-            yield from depsgraph_objects(depsgraph, self.space_data,
-                                            self.shading_data.use_scene_lights)
-
-        depsgraph_keys = set(object.sdf_name(obj) for obj in depsgraph_objects())
-        usd_object_keys = set(prim.GetName() for prim in objects_prim.GetAllChildren())
-        keys_to_remove = usd_object_keys - depsgraph_keys
-        keys_to_add = depsgraph_keys - usd_object_keys
+        depsgraph_objs = {object.sdf_name(obj): obj
+                          for obj in utils.depsgraph_objects(depsgraph, self.space_data,
+                                                             self.shading_data.use_scene_lights)}
+        usd_object_keys = {prim.GetName() for prim in objects_prim.GetAllChildren()}
+        keys_to_remove = usd_object_keys - depsgraph_objs.keys()
+        keys_to_add = depsgraph_objs.keys() - usd_object_keys
 
         if keys_to_remove:
             log("Object keys to remove", keys_to_remove)
+            remove_prim = self.stage.RemovePrim
+            objects_path = objects_prim.GetPath().pathString
             for key in keys_to_remove:
-                self.stage.RemovePrim(f"{objects_prim.GetPath()}/{key}")
+                remove_prim(f"{objects_path}/{key}")
 
         if keys_to_add:
             log("Object keys to add", keys_to_add)
-            for obj in depsgraph_objects():
-                obj_key = object.sdf_name(obj)
-                if obj_key not in keys_to_add:
-                    continue
-
-                object.sync(objects_prim, obj)
+            # objects are added in depsgraph order to keep prims order stable
+            for key, obj in depsgraph_objs.items():
+                if key in keys_to_add:
+                    object.sync(objects_prim, obj)
@@ -47,10 +47,14 @@ def get_material_input_node(material, input_socket_key: str):
         return None
 
     socket_in = output_node.inputs[input_socket_key]
-    if not socket_in.is_linked or not socket_in.links[0].is_valid:
+    if not socket_in.is_linked:
         return None
 
-    return socket_in.links[0].from_node
+    link = socket_in.links[0]
+    if not link.is_valid:
+        return None
+
+    return link.from_node
 
 
 def sync(materials_prim, mat: bpy.types.Material, input_socket_key='Surface', *,
@@ -79,12 +83,9 @@ def sync(materials_prim, mat: bpy.types.Material, input_socket_key='Surface', *,
 
     # TODO use MaterialX for material
     # create appropriate USD shader
-    if node.bl_idname == 'ShaderNodeBsdfPrincipled':
-        create_principled_shader(stage, usd_mat, mat_path, node)
-    elif node.bl_idname == 'ShaderNodeEmission':
-        create_emission_shader(stage, usd_mat, mat_path, node)
-    elif node.bl_idname == 'ShaderNodeBsdfDiffuse':  # used by Material Preview
-        create_diffuse_shader(stage, usd_mat, mat_path, node)
+    create_shader = _shader_creators.get(node.bl_idname)
+    if create_shader:
+        create_shader(stage, usd_mat, mat_path, node)
     else:
         log.info(f"unsupported node {node.bl_idname} of material {mat.name_full}")
 
@@ -93,22 +94,23 @@ def sync(materials_prim, mat: bpy.types.Material, input_socket_key='Surface', *,
     return usd_mat
 
 
-# TODO move parsing to shader nodes parser
-def get_input_default(node, socket_key):
-    def _parse_val(val):
-        """ Turn a blender node val or default value for input into something that works well with USD """
+def _parse_val(val):
+    """ Turn a blender node val or default value for input into something that works well with USD """
+
+    if isinstance(val, (int, float)):
+        return float(val)
 
-        if isinstance(val, (int, float)):
-            return float(val)
+    if len(val) in (3, 4):
+        return tuple(val[:3])
 
-        if len(val) in (3, 4):
-            return tuple(val[:3])
+    if isinstance(val, str):
+        return val
 
-        if isinstance(val, str):
-            return val
+    raise TypeError("Unknown value type to pass to rpr", val)
 
-        raise TypeError("Unknown value type to pass to rpr", val)
 
+# TODO move parsing to shader nodes parser
+def get_input_default(node, socket_key):
     socket_in = node.inputs[socket_key]
     return _parse_val(socket_in.default_value)
 
@@ -156,6 +158,13 @@ def create_emission_shader(stage, usd_material, mat_key, node):
     usd_material.CreateSurfaceOutput().ConnectToSource(pbr_shader, "surface")
 
 
+_shader_creators = {
+    'ShaderNodeBsdfPrincipled': create_principled_shader,
+    'ShaderNodeEmission': create_emission_shader,
+    'ShaderNodeBsdfDiffuse': create_diffuse_shader,  # used by Material Preview
+}
+
+
 def sync_update(materials_prim, mat: bpy.types.Material, obj: bpy.types.Object = None):
     """ Recreates existing material """
 
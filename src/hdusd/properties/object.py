@@ -33,7 +33,8 @@ class ObjectProperties(HdUSDProperties):
 
         if not prim or str(prim.GetTypeName()) != 'Xform':
             self.cached_stage.clear()
-            prim_obj.name = self.sdf_path = "/"
+            self.sdf_path = "/"
+            self._set_object_name(self.sdf_path)
             prim_obj.matrix_world = mathutils.Matrix.Identity(4)
 
             # hiding, deactivating and deselecting prim object
@@ -44,7 +45,8 @@ class ObjectProperties(HdUSDProperties):
             return
 
         self.cached_stage.assign(prim.GetStage())
-        prim_obj.name = self.sdf_path = str(prim.GetPath())
+        self.sdf_path = prim.GetPath().pathString
+        self._set_object_name(self.sdf_path)
         xform = UsdGeom.Xform(prim)
         ops = xform.GetOrderedXformOps()
         if ops:
@@ -60,6 +62,15 @@ class ObjectProperties(HdUSDProperties):
                 context.selected_objects[0].select_set(False)
             prim_obj.select_set(True)
 
+    def _set_object_name(self, name):
+        """
+        Renames prim object only if name was changed, because on every rename
+        Blender checks name for uniqueness through all objects
+        """
+        prim_obj = self.id_data
+        if prim_obj.name != name:
+            prim_obj.name = name
+
     def sync_to_prim(self):
         stage = self.cached_stage()
         if not stage:
@@ -58,10 +58,12 @@ class PrimPropertyItem(PropertyGroup):
 
 class UsdListItem(PropertyGroup):
     sdf_path: StringProperty(name='USD Path', default="")
+    # indent is stored on init, because it is used a lot in drawing and expanding of items
+    indent: IntProperty(name='Indent', default=0)
 
-    @property
-    def indent(self):
-        return self.sdf_path.count('/') - 1
+    def init(self, sdf_path):
+        self.sdf_path = sdf_path
+        self.indent = sdf_path.count('/') - 1
 
 
 class UsdList(PropertyGroup):
@@ -82,7 +84,7 @@ class UsdList(PropertyGroup):
             prop.init(name, value)
 
         add_prop("Name", prim.GetName())
-        add_prop("Path", str(prim.GetPath()))
+        add_prop("Path", prim.GetPath().pathString)
         add_prop("Type", str(prim.GetTypeName()))
 
     items: CollectionProperty(type=UsdListItem)
@@ -99,7 +101,7 @@ class UsdList(PropertyGroup):
         if stage:
             for prim in stage.GetPseudoRoot().GetChildren():
                 item = self.items.add()
-                item.sdf_path = str(prim.GetPath())
+                item.init(prim.GetPath().pathString)
 
     def get_prim(self, item):
         stage = self.cached_stage()
@@ -127,7 +129,9 @@ def depsgraph_update(depsgraph):
 
     upd = depsgraph.updates[0]
     obj = upd.id
-    if not isinstance(obj, bpy.types.Object) or not obj.hdusd.is_usd:
+    if not isinstance(obj, bpy.types.Object):
         return
 
-    obj.hdusd.sync_to_prim()
+    hdusd = obj.hdusd
+    if hdusd.is_usd:
+        hdusd.sync_to_prim()
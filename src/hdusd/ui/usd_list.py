@@ -14,12 +14,19 @@
 #********************************************************************
 import bpy
 
-from pxr import UsdGeom
+from pxr import Usd, UsdGeom
 
 from . import HdUSD_Panel
 from ..usd_nodes.nodes.base_node import USDNode
 
 
+def has_children(prim):
+    """ Checks if prim has any child, not getting list of all children like GetChildren() does """
+    prim_range = iter(Usd.PrimRange(prim, Usd.PrimDefaultPredicate))
+    next(prim_range, None)  # skipping prim itself
+    return next(prim_range, None) is not None
+
+
 class HDUSD_OP_usd_list_item_expand(bpy.types.Operator):
     """Expand USD item"""
     bl_idname = "hdusd.usd_list_item_expand"
@@ -39,13 +46,14 @@ class HDUSD_OP_usd_list_item_expand(bpy.types.Operator):
         if len(items) > self.index + 1 and items[self.index + 1].indent > item.indent:
             next_index = self.index + 1
             item_indent = item.indent
+            remove_item = items.remove
             removed_items = 0
             while True:
                 if next_index >= len(items):
                     break
                 if items[next_index].indent <= item_indent:
                     break
-                items.remove(next_index)
+                remove_item(next_index)
                 removed_items += 1
 
             if usd_list.item_index > self.index:
@@ -54,11 +62,12 @@ class HDUSD_OP_usd_list_item_expand(bpy.types.Operator):
         else:
             prim = usd_list.get_prim(item)
 
+            add_item, move_item = items.add, items.move
             added_items = 0
             for child_index, child_prim in enumerate(prim.GetChildren(), self.index + 1):
-                child_item = items.add()
-                child_item.sdf_path = str(child_prim.GetPath())
-                items.move(len(items) - 1, child_index)
+                child_item = add_item()
+                child_item.init(child_prim.GetPath().pathString)
+                move_item(len(items) - 1, child_index)
                 added_items += 1
 
             if usd_list.item_index > self.index:
@@ -109,7 +118,7 @@ class HDUSD_UL_usd_list_item(bpy.types.UIList):
         visible = UsdGeom.Imageable(prim).ComputeVisibility() != 'invisible'
 
         col = layout.column()
-        if not prim.GetChildren():
+        if not has_children(prim):
             icon = 'DOT'
             col.enabled = False
         elif len(items) > index + 1 and items[index + 1].indent > item.indent:
@@ -14,6 +14,7 @@
 # ********************************************************************
 import bpy
 
+from .nodes.base_node import clear_compute_keys
 from .nodes.hydra_render import HydraRenderNode
 from .nodes.print_file import PrintFileNode
 from .nodes.write_file import WriteFileNode
@@ -60,13 +61,18 @@ class USDTree(bpy.types.ShaderNodeTree):
 
         self.is_updating = True
 
+        # computing output nodes, required nodes are computed through their input links.
+        # Active node at the moment of update is also computed to have actual data in its
+        # USD list. Other nodes not connected to output nodes are not computed: selecting
+        # such node doesn't call update(), so its USD list shows the data of its last compute
+        # (or nothing) until the tree is updated again or the node is connected.
+        # Nodes are recomputed only if their inputs or properties were changed
+        active_node = self.nodes.active
+        computed_nodes = set()
         for node in self.nodes:
-            if node.inputs:
-                node.cached_stage.clear()
+            if node.is_output or node == active_node:
+                node.final_compute(computed_nodes=computed_nodes)
 
-        for node in self.nodes:
-            node.final_compute()
-            
         self.is_updating = False
 
     def reset(self):
@@ -76,10 +82,11 @@ class USDTree(bpy.types.ShaderNodeTree):
         self.is_updating = True
 
         for node in self.nodes:
-            node.cached_stage.clear()
+            node.clear_cache()
 
+        computed_nodes = set()
         for node in self.nodes:
-            node.final_compute()
+            node.final_compute(computed_nodes=computed_nodes)
 
         self.is_updating = False
 
@@ -125,6 +132,9 @@ def get_usd_nodetree():
 
 
 def reset():
+    # compute keys of previous file could match pointers of new nodes
+    clear_compute_keys()
+
     for group in bpy.data.node_groups:
         if isinstance(group, USDTree):
             group.reset()
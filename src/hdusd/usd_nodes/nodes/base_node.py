@@ -15,9 +15,18 @@
 import bpy
 from pxr import Usd
 
+from ...utils import stage_cache
 from . import log
 
 
+# compute keys of computed nodes by node pointer, are used to check if node has to be recomputed
+_compute_keys = {}
+
+
+def clear_compute_keys():
+    _compute_keys.clear()
+
+
 class USDError(BaseException):
     pass
 
@@ -31,6 +40,20 @@ class USDNode(bpy.types.Node):
     input_names = ("Input",)
     output_name = "Output"
 
+    # output nodes are computed on tree update, other nodes are computed through their links
+    is_output = False
+    # nodes with side effects of compute() (like export to file) have to be computed
+    # on every compute pass, because input stages could be changed in place
+    use_compute_cache = True
+
+    # names of node properties which affect compute result, are filled in register()
+    prop_names = ()
+
+    @classmethod
+    def register(cls):
+        cls.prop_names = tuple(prop.identifier for prop in cls.bl_rna.properties
+                               if prop.is_runtime and prop.identifier != 'hdusd')
+
     @classmethod
     def poll(cls, tree: bpy.types.NodeTree):
         return tree.bl_idname == cls.tree_idname
@@ -65,14 +88,64 @@ class USDNode(bpy.types.Node):
         """
         log("compute", self, group_nodes)
 
-        stage = self.cached_stage()
+        # resolving hdusd properties chain once
+        usd_list = self.hdusd.usd_list
+        cached_stage = usd_list.cached_stage
+
+        # node is checked only once during one compute pass, next calls return cached stage
+        computed_nodes = kwargs.setdefault('computed_nodes', set())
+        node_ptr = self.as_pointer()
+        if node_ptr in computed_nodes:
+            return cached_stage()
+
+        computed_nodes.add(node_ptr)
+
+        stage = cached_stage()
+        key = None
+        if not self.use_compute_cache:
+            cached_stage.clear()
+            stage = None
+
+        elif self.inputs:
+            key = self._compute_key(group_nodes, **kwargs)
+            if stage and _compute_keys.get(node_ptr) != (cached_stage.id, key):
+                # input stages or node properties were changed since last compute
+                cached_stage.clear()
+                stage = None
+
         if not stage:
             stage = self.compute(group_nodes=group_nodes, **kwargs)
-            self.cached_stage.assign(stage)
-            self.hdusd.usd_list.update_items()
+            cached_stage.assign(stage)
+            if key is not None:
+                # input nodes are already computed in this pass, so key stays actual.
+                # Own stage id is stored too: stage restored by undo doesn't match the key
+                _compute_keys[node_ptr] = (cached_stage.id, key)
+
+            usd_list.update_items()
 
         return stage
 
+    def _compute_key(self, group_nodes, **kwargs):
+        """
+        Returns key which identifies result of compute(): ids of input stages and
+        values of node properties. Input nodes are computed here if it is required.
+        """
+        input_ids = []
+        for socket_in in self.inputs:
+            link = socket_in.links[0] if socket_in.is_linked else None
+            if link and self._compute_link(link, group_nodes=group_nodes, **kwargs):
+                input_ids.append(link.from_node.cached_stage.id)
+            else:
+                input_ids.append(stage_cache.ID_NO_STAGE)
+
+        prop_values = []
+        for name in self.prop_names:
+            value = getattr(self, name)
+            # keeping pointers instead of references to blender data
+            prop_values.append(value.as_pointer() if isinstance(value, bpy.types.ID) else value)
+
+        return tuple(input_ids), tuple(prop_values)
+
     def _compute_node(self, node, group_node=None, **kwargs):
         """
         Exports node with output socket.
@@ -101,13 +174,19 @@ class USDNode(bpy.types.Node):
     def get_input_link(self, socket_key: [str, int], **kwargs):
         """Returns linked parsed node or None if nothing is linked or not link is not valid"""
 
+        # socket.links searches through all links of node tree, so it is called once
+        # and only for linked socket
         socket_in = self.inputs[socket_key]
-        if not socket_in.links:
+        if not socket_in.is_linked:
             return None
 
-        link = socket_in.links[0]
+        return self._compute_link(socket_in.links[0], **kwargs)
+
+    def _compute_link(self, link, **kwargs):
+        """Returns parsed node linked by input link"""
+
         if not link.is_valid:
-            log.error("Invalid link found", link, socket_in, self)
+            log.error("Invalid link found", link, link.to_socket, self)
 
         # removing 'socket_out' from kwargs before transferring to _compute_node
         kwargs.pop('socket_out', None)
@@ -117,8 +196,12 @@ class USDNode(bpy.types.Node):
     def cached_stage(self):
         return self.hdusd.usd_list.cached_stage
 
-    def free(self):
+    def clear_cache(self):
         self.cached_stage.clear()
+        _compute_keys.pop(self.as_pointer(), None)
+
+    def free(self):
+        self.clear_cache()
 
 
 class RenderTaskNode(USDNode):
@@ -24,6 +24,7 @@ class HydraRenderNode(USDNode):
     bl_label = "Render USD via Hydra"
 
     output_name = ""
+    is_output = True
 
     render_type: bpy.props.EnumProperty(
         name='Type',
@@ -49,11 +49,15 @@ class MergeNode(USDNode):
     def compute(self, **kwargs):
         from pxr import Usd, UsdGeom
 
-        ref_stages = []
+        # stages are keyed by root layer path, because they are referenced by it:
+        # the same stage linked to several inputs is referenced only once
+        ref_stages = {}
         for i in range(self.inputs_number):
             stage = self.get_input_link(i, **kwargs)
             if stage:
-                ref_stages.append(stage)
+                ref_stages.setdefault(stage.GetRootLayer().realPath, stage)
+
+        ref_stages = tuple(ref_stages.values())
 
         if not ref_stages:
             return None
@@ -70,7 +74,7 @@ class MergeNode(USDNode):
         for i, ref_stage in enumerate(ref_stages, 1):
             ref = stage.DefinePrim(f"/merge/ref{i}", 'Xform')
             default_prim = ref_stage.GetDefaultPrim()
-            override_prim = stage.OverridePrim(str(ref.GetPath()) + '/' + default_prim.GetName())
+            override_prim = stage.OverridePrim(ref.GetPath().pathString + '/' + default_prim.GetName())
             override_prim.GetReferences().AddReference(ref_stage.GetRootLayer().realPath)
 
         return stage
@@ -20,6 +20,9 @@ class PrintFileNode(USDNode):
     bl_idname = 'usd.PrintFileNode'
     bl_label = "Print USD to stdout"
 
+    is_output = True
+    use_compute_cache = False
+
     def compute(self, **kwargs):
         stage = self.get_input_link('Input', **kwargs)
         if stage:
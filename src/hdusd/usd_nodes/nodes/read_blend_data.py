@@ -14,8 +14,6 @@
 # ********************************************************************
 import bpy
 
-from pxr import UsdGeom
-
 from .base_node import USDNode
 from ...export import object, sdf_path
 from ...utils import depsgraph_objects
@@ -36,8 +34,9 @@ class ReadBlendDataNode(USDNode):
         objects_prim = stage.GetPrimAtPath(f"/{depsgraph.scene.name}/objects")
 
         # removing all children from objects_prim
+        remove_prim = stage.RemovePrim
         for obj_prim in objects_prim.GetAllChildren():
-            stage.RemovePrim(obj_prim.GetPath())
+            remove_prim(obj_prim.GetPath())
 
         self._export_depsgraph(objects_prim, depsgraph)
         self.hdusd.usd_list.update_items()
@@ -81,6 +80,8 @@ class ReadBlendDataNode(USDNode):
             flow.prop(self, 'object_to_export')
 
     def compute(self, **kwargs):
+        from pxr import UsdGeom
+
         depsgraph = bpy.context.evaluated_depsgraph_get()
 
         stage = self.cached_stage.create()
@@ -103,6 +104,7 @@ class ReadBlendDataNode(USDNode):
 
         objects_prim = stage.GetPrimAtPath(f"/{depsgraph.scene.name}/objects")
         if self._update_depsgraph(objects_prim, depsgraph):
+            # USD list is rebuilt only if objects were added or removed
             self.hdusd.usd_list.update_items()
 
     def _export_depsgraph(self, objects_prim, depsgraph):
@@ -121,14 +123,35 @@ class ReadBlendDataNode(USDNode):
                 object.sync(objects_prim, obj_col.evaluated_get(depsgraph))
 
         elif self.export_type == 'OBJECT':
-            if not self.object_to_export or self.object_to_export.hdusd.is_usd:
+            obj = self.object_to_export
+            if not obj or obj.hdusd.is_usd:
                 return
 
-            object.sync(objects_prim, self.object_to_export.evaluated_get(depsgraph))
+            object.sync(objects_prim, obj.evaluated_get(depsgraph))
+
+    @staticmethod
+    def _object_children_names(obj_prim):
+        """ Returns names of object prim children and of scene materials """
+        # materials are synced to "materials" prim of root prim, see mesh._assign_materials()
+        materials_prim = obj_prim.GetParent().GetParent().GetChild("materials")
+        obj_names = [prim.GetName() for prim in obj_prim.GetAllChildren()]
+        mat_names = [prim.GetName() for prim in materials_prim.GetAllChildren()] \
+            if materials_prim.IsValid() else []
+
+        return obj_names, mat_names
 
     def _update_depsgraph(self, objects_prim, depsgraph):
+        """
+        Updates exported objects by depsgraph updates.
+        Returns True if prims were added or removed, so USD list has to be rebuilt.
+        """
         ret = False
 
+        # node properties are resolved once for all updates
+        export_type = self.export_type
+        collection_to_export = self.collection_to_export
+        object_to_export = self.object_to_export
+
         for update in depsgraph.updates:
             if isinstance(update.id, bpy.types.Object):
                 obj = update.id
@@ -136,69 +159,82 @@ class ReadBlendDataNode(USDNode):
                     continue
 
                 # checking if object has to be updated
-                if self.export_type == 'SCENE':
+                if export_type == 'SCENE':
                     pass
 
-                elif self.export_type == 'COLLECTION':
-                    if not self.collection_to_export or \
-                            obj.name not in self.collection_to_export.objects:
+                elif export_type == 'COLLECTION':
+                    if not collection_to_export or \
+                            obj.name not in collection_to_export.objects:
                         continue
 
-                elif self.export_type == 'OBJECT':
-                    if not self.object_to_export or \
-                            object.sdf_name(self.object_to_export) != object.sdf_name(obj):
+                elif export_type == 'OBJECT':
+                    if not object_to_export or \
+                            object.sdf_name(object_to_export) != object.sdf_name(obj):
                         continue
 
+                obj_prim = objects_prim.GetChild(object.sdf_name(obj))
+                if not obj_prim.IsValid():
+                    # sync_update() creates object prim if it doesn't exist yet
+                    ret = True
+                    prev_names = None
+                elif update.is_updated_geometry:
+                    # geometry update recreates children of object prim and syncs materials
+                    prev_names = self._object_children_names(obj_prim)
+                else:
+                    prev_names = None
+
                 # updating object
                 object.sync_update(objects_prim, obj,
                                    update.is_updated_geometry, update.is_updated_transform)
 
-                ret = True
+                if prev_names is not None and \
+                        prev_names != self._object_children_names(obj_prim):
+                    ret = True
 
             elif isinstance(update.id, bpy.types.Collection):
                 coll = update.id
 
-                current_keys = set(prim.GetName() for prim in objects_prim.GetAllChildren())
+                current_keys = {prim.GetName() for prim in objects_prim.GetAllChildren()}
                 required_keys = set()
-                depsgraph_keys = set(object.sdf_name(obj)
-                                     for obj in depsgraph_objects(depsgraph))
+                depsgraph_objs = {object.sdf_name(obj): obj
+                                  for obj in depsgraph_objects(depsgraph)}
+                depsgraph_keys = depsgraph_objs.keys()
 
-                if self.export_type == 'SCENE':
+                if export_type == 'SCENE':
                     required_keys = depsgraph_keys
 
-                elif self.export_type == 'COLLECTION':
-                    if not self.collection_to_export:
+                elif export_type == 'COLLECTION':
+                    if not collection_to_export:
                         continue
 
-                    if coll.name != self.collection_to_export.name:
+                    if coll.name != collection_to_export.name:
                         continue
 
-                    required_keys = set(object.sdf_name(obj) for obj in coll.objects)
-                    required_keys.intersection_update(depsgraph_keys)
+                    required_keys = {object.sdf_name(obj) for obj in coll.objects} & depsgraph_keys
 
-                elif self.export_type == 'OBJECT':
-                    if not self.object_to_export:
+                elif export_type == 'OBJECT':
+                    if not object_to_export:
                         continue
 
-                    if object.sdf_name(self.object_to_export) in depsgraph_keys:
-                        required_keys = {object.sdf_name(self.object_to_export)}
+                    if object.sdf_name(object_to_export) in depsgraph_keys:
+                        required_keys = {object.sdf_name(object_to_export)}
 
                 keys_to_remove = current_keys - required_keys
                 keys_to_add = required_keys - current_keys
 
                 if keys_to_remove:
+                    remove_prim = objects_prim.GetStage().RemovePrim
+                    objects_path = objects_prim.GetPath().pathString
                     for key in keys_to_remove:
-                        objects_prim.GetStage().RemovePrim(f"{objects_prim.GetPath()}/{key}")
+                        remove_prim(f"{objects_path}/{key}")
 
                     ret = True
 
                 if keys_to_add:
-                    for obj in depsgraph_objects(depsgraph):
-                        obj_key = object.sdf_name(obj)
-                        if obj_key not in keys_to_add:
-                            continue
-
-                        object.sync(objects_prim, obj)
+                    # objects are added in depsgraph order to keep prims order stable
+                    for key, obj in depsgraph_objs.items():
+                        if key in keys_to_add:
+                            object.sync(objects_prim, obj)
 
                     ret = True
 
@@ -21,6 +21,9 @@ class WriteFileNode(USDNode):
     bl_idname = 'usd.WriteFileNode'
     bl_label = "Write USD File"
 
+    is_output = True
+    use_compute_cache = False
+
     file_path: bpy.props.StringProperty(name="USD File", subtype='FILE_PATH')
 
     def draw_buttons(self, context, layout):